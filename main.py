@@ -4,16 +4,38 @@
 # from src.api import contacts, utils
 
 import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from starlette.responses import JSONResponse
 from slowapi.errors import RateLimitExceeded
 from src.api import utils, contacts, auth, users
+from src.database.db import sessionmanager
+from src.services import email_queue
 
 logger = logging.getLogger("rate_limiter")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan: the session manager (and its pool) is created at
+    import and shared by every request; dispose of it on shutdown so
+    connections are returned to the database cleanly.
+    """
+    logger.info("Database pool: %s", sessionmanager.pool_status())
+    email_queue.start()
+    yield
+    await email_queue.shutdown()
+    await sessionmanager.close()
+
+
 app = FastAPI(
     servers=[{"url": "http://localhost:8000"}],
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 app.add_middleware(
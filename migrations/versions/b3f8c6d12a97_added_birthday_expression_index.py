@@ -0,0 +1,37 @@
+"""Added birthday expression index
+
+Revision ID: b3f8c6d12a97
+Revises: e7a91b25c3d4
+Create Date: 2026-08-31 12:41:09.573812
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f8c6d12a97'
+down_revision: Union[str, None] = 'e7a91b25c3d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Matches the MMDD expression used by get_upcoming_birthdays so the
+    # per-user window ranges become an index seek instead of a table scan.
+    # extract() on a date is IMMUTABLE, which index expressions require;
+    # to_char() is only STABLE (locale-dependent) and would be rejected.
+    op.execute(
+        "CREATE INDEX ix_contacts_bday "
+        "ON contacts (user_id, "
+        "((extract(month from birthday)::int * 100"
+        " + extract(day from birthday)::int)))"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX ix_contacts_bday")
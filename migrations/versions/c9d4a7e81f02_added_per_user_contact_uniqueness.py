@@ -0,0 +1,40 @@
+"""Added per-user contact uniqueness
+
+Revision ID: c9d4a7e81f02
+Revises: b3f8c6d12a97
+Create Date: 2026-08-31 14:27:33.408151
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9d4a7e81f02'
+down_revision: Union[str, None] = 'b3f8c6d12a97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Email/phone uniqueness becomes per-user and serves as the ON CONFLICT
+    # target for the single-statement contact create.
+    op.drop_constraint('contacts_email_key', 'contacts', type_='unique')
+    op.drop_constraint('contacts_phone_key', 'contacts', type_='unique')
+    op.create_index(
+        'uq_contacts_user_email', 'contacts', ['user_id', 'email'], unique=True
+    )
+    op.create_index(
+        'uq_contacts_user_phone', 'contacts', ['user_id', 'phone'], unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_contacts_user_phone', table_name='contacts')
+    op.drop_index('uq_contacts_user_email', table_name='contacts')
+    op.create_unique_constraint('contacts_phone_key', 'contacts', ['phone'])
+    op.create_unique_constraint('contacts_email_key', 'contacts', ['email'])
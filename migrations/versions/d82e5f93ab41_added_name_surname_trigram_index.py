@@ -0,0 +1,34 @@
+"""Added name surname trigram index
+
+Revision ID: d82e5f93ab41
+Revises: c9d4a7e81f02
+Create Date: 2026-08-31 15:09:54.112687
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd82e5f93ab41'
+down_revision: Union[str, None] = 'c9d4a7e81f02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Complements contacts_email_trgm so the non-anchored name filter is
+    # index-served as well.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_contacts_name_trgm ON contacts "
+        "USING gin (name gin_trgm_ops, surname gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX ix_contacts_name_trgm")
@@ -0,0 +1,37 @@
+"""Added contact search indexes
+
+Revision ID: e7a91b25c3d4
+Revises: 14bf3bdd67b0
+Create Date: 2026-08-31 11:02:47.918234
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7a91b25c3d4'
+down_revision: Union[str, None] = '14bf3bdd67b0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "contacts_user_surname_name_idx",
+        "contacts",
+        ["user_id", "surname", "name"],
+    )
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX contacts_email_trgm ON contacts USING gin (email gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX contacts_email_trgm")
+    op.drop_index("contacts_user_surname_name_idx", table_name="contacts")
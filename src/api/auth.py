@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi import (
     APIRouter,
     Depends,
@@ -10,12 +12,19 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.security import OAuth2PasswordRequestForm
 
 from src.schemas import UserCreate, Token, User, RequestEmail
-from src.services.email import send_confirm_email, send_reset_password_email
+from src.services import email_queue, tasks
+from src.services.email import (
+    invalidate_verify_token,
+    send_confirm_email,
+    send_reset_password_email,
+)
 from src.services.auth import (
     create_access_token,
-    Hash,
+    hasher,
     get_email_from_token,
     get_password_from_token,
+    get_user_from_db,
+    invalidate_user_cache,
 )
 from src.services.users import UserService
 from src.database.db import get_db
@@ -25,9 +34,36 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 
 
 def get_user_service(db: AsyncSession = Depends(get_db)) -> UserService:
+    """
+    Request-scoped UserService factory shared by the handlers below.
+    """
     return UserService(db)
 
 
+def enqueue_email(background_tasks: BackgroundTasks, send_func, *args, **kwargs):
+    """
+    Deliver an email off the request path.
+
+    When a Celery broker is configured, the send is enqueued on the email
+    worker so the HTTP worker returns immediately; without a broker it goes
+    onto the in-process asyncio queue started by the app lifespan, and only
+    when neither is available (tests, scripts) does it fall back to FastAPI
+    BackgroundTasks, which runs after the response on the serving task.
+
+    Parameters:
+    - background_tasks (BackgroundTasks): The fallback task runner.
+    - send_func: The email coroutine to run (send_confirm_email or send_reset_password_email).
+    """
+    send_name = getattr(send_func, "__name__", "")
+    task_name = f"emails.{send_name}"
+    if tasks.celery_enabled() and task_name in tasks.celery_app.tasks:
+        tasks.celery_app.send_task(task_name, args=args, kwargs=kwargs)
+    elif email_queue.is_running() and email_queue.has_sender(send_name):
+        email_queue.enqueue_email(send_name, *args, **kwargs)
+    else:
+        background_tasks.add_task(send_func, *args, **kwargs)
+
+
 USER_EXISTS_EMAIL = HTTPException(
     status_code=status.HTTP_409_CONFLICT,
     detail="User with this email already exists",
@@ -54,13 +90,28 @@ VERIFICATION_ERROR = HTTPException(
     detail="Verification error",
 )
 
+EMAIL_NOT_CONFIRMED_AT_RESET = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="Your email address is not confirmed",
+)
+
+INVALID_OR_EXPIRED_TOKEN = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="Invalid or expired token",
+)
+
+USER_EMAIL_NOT_FOUND = HTTPException(
+    status_code=status.HTTP_404_NOT_FOUND,
+    detail="User with this email was not found",
+)
+
 
 @router.post("/register", response_model=User, status_code=status.HTTP_201_CREATED)
 async def register_user(
     user_data: UserCreate,
     background_tasks: BackgroundTasks,
     request: Request,
-    db: AsyncSession = Depends(get_db),
+    user_service: UserService = Depends(get_user_service),
 ):
     """
     Registering a new user.
@@ -69,7 +120,7 @@ async def register_user(
     - user_data (UserCreate): The data of the new user.
     - background_tasks (BackgroundTasks): The object to run the background tasks.
     - request: A request to get the base URL.
-    - db (AsyncSession): A session to work with the database.
+    - user_service (UserService): The user service.
 
     Returns:
     - User: Data of the registered user.
@@ -77,18 +128,23 @@ async def register_user(
     Throws:
     - HTTP exception (409): If a user with this address or name already exists.
     """
-    user_service = UserService(db)
-    if await user_service.get_user_by_email(user_data.email):
-        raise USER_EXISTS_EMAIL
-
-    if await user_service.get_user_by_username(user_data.username):
+    existing_user = await user_service.get_user_by_email_or_username(
+        user_data.email, user_data.username
+    )
+    if existing_user:
+        if existing_user.email == user_data.email:
+            raise USER_EXISTS_EMAIL
         raise USER_EXISTS_USERNAME
 
-    user_data.password = Hash().get_password_hash(user_data.password)
+    user_data.password = await hasher.get_password_hash(user_data.password)
     new_user = await user_service.create_user(user_data)
 
-    background_tasks.add_task(
-        send_confirm_email, new_user.email, new_user.username, request.base_url
+    enqueue_email(
+        background_tasks,
+        send_confirm_email,
+        new_user.email,
+        new_user.username,
+        str(request.base_url),
     )
 
     return new_user
@@ -112,15 +168,25 @@ async def login_user(
     Throws:
     - HTTPException (401): If the login or password is incorrect or the email is not verified.
     """
-    user_service = UserService(db)
-    user = await user_service.get_user_by_username(form_data.username)
+    user = await get_user_from_db(form_data.username, db)
 
-    if not user or not Hash().verify_password(form_data.password, user.hashed_password):
+    valid, new_hash = False, None
+    if user:
+        valid, new_hash = await hasher.verify_and_update(
+            form_data.password, user.hashed_password
+        )
+    if not valid:
         raise INVALID_CREDENTIALS
 
     if not user.confirmed:
         raise EMAIL_NOT_CONFIRMED
 
+    if new_hash:
+        # Transparent migration: legacy bcrypt or pre-pepper hashes are
+        # rewritten as peppered argon2id on the first successful login.
+        await UserService(db).reset_password(user.id, new_hash)
+        await invalidate_user_cache(user.username)
+
     access_token = await create_access_token(data={"sub": user.username})
     return {"access_token": access_token, "token_type": "bearer"}
 
@@ -128,14 +194,14 @@ async def login_user(
 @router.get("/confirmed_email/{token}")
 async def confirmed_email(
     token: str,
-    db: AsyncSession = Depends(get_db)
+    user_service: UserService = Depends(get_user_service)
 ):
     """
     Confirmation of the user's email.
 
     Parameters:
     - token (str): The confirmation token.
-    - db (AsyncSession): The database session.
+    - user_service (UserService): The user service.
 
     Returns:
     - dict: A message indicating successful confirmation.
@@ -144,7 +210,6 @@ async def confirmed_email(
     - HTTPException (400): If the token is invalid or the user is not found.
     """
     email = await get_email_from_token(token)
-    user_service = UserService(db)
     user = await user_service.get_user_by_email(email)
 
     if not user:
@@ -154,6 +219,8 @@ async def confirmed_email(
         return {"message": "Your email address is already confirmed"}
 
     await user_service.confirmed_email(email)
+    await invalidate_user_cache(user.username)
+    invalidate_verify_token(email)
     return {"message": "Email successfully confirmed"}
 
 
@@ -162,7 +229,7 @@ async def request_email(
     body: RequestEmail,
     background_tasks: BackgroundTasks,
     request: Request,
-    db: AsyncSession = Depends(get_db)
+    user_service: UserService = Depends(get_user_service)
 ):
     """
     Send a confirmation email to the user.
@@ -171,20 +238,23 @@ async def request_email(
     - body (RequestEmail): Data for the request (user's email).
     - background_tasks (BackgroundTasks): The object to run the background tasks.
     - request (Request): The request to get the base URL.
-    - db (AsyncSession): The database session.
+    - user_service (UserService): The user service.
 
     Returns:
     - dict: A message about the request sent.
     """
-    user_service = UserService(db)
     user = await user_service.get_user_by_email(body.email)
 
     if user and user.confirmed:
         return {"message": "Your email address is already confirmed"}
 
     if user:
-        background_tasks.add_task(
-            send_confirm_email, user.email, user.username, request.base_url
+        enqueue_email(
+            background_tasks,
+            send_confirm_email,
+            user.email,
+            user.username,
+            str(request.base_url),
         )
 
     return {"message": "Check your email for confirmation instructions"}
@@ -195,7 +265,7 @@ async def reset_password_request(
     body: ResetPassword,
     background_tasks: BackgroundTasks,
     request: Request,
-    db: AsyncSession = Depends(get_db)
+    user_service: UserService = Depends(get_user_service)
 ):
     """
     Request for password reset.
@@ -204,7 +274,7 @@ async def reset_password_request(
     - body (ResetPassword): Data for the request (email and new password).
     - background_tasks (BackgroundTasks): The object to run the background tasks.
     - request (Request): The request to get the base URL.
-    - db (AsyncSession): The database session.
+    - user_service (UserService): The user service.
 
     Returns:
     - dict: A message about the request sent.
@@ -212,20 +282,17 @@ async def reset_password_request(
     Throws:
     - HTTPException (400): If the email is not verified.
     """
-    user_service = UserService(db)
     user = await user_service.get_user_by_email(body.email)
     if not user:
         return {"message": "Check your email for password reset instructions"}
     if not user.confirmed:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Your email address is not confirmed",
-        )
-    hashed_password = Hash().get_password_hash(body.password)
+        raise EMAIL_NOT_CONFIRMED_AT_RESET
+    hashed_password = await hasher.get_password_hash(body.password)
     reset_token = await create_access_token(
         data={"sub": user.email, "password": hashed_password}
     )
-    background_tasks.add_task(
+    enqueue_email(
+        background_tasks,
         send_reset_password_email,
         to_email=body.email,
         username=user.username,
@@ -238,14 +305,14 @@ async def reset_password_request(
 @router.get("/confirm_reset_password/{token}")
 async def confirm_reset_password(
     token: str,
-    db: AsyncSession = Depends(get_db)
+    user_service: UserService = Depends(get_user_service)
 ):
     """
     Confirmation of password reset.
 
     Parameters:
     - token (str): The password reset confirmation token.
-    - db (AsyncSession): The database session.
+    - user_service (UserService): The user service.
 
     Returns:
     - dict: A message indicating successful password reset.
@@ -254,19 +321,14 @@ async def confirm_reset_password(
     - HTTPException (400): If the token is invalid.
     - HTTPException (404): If the user was not found.
     """
-    email = await get_email_from_token(token)
-    hashed_password = await get_password_from_token(token)
+    email, hashed_password = await asyncio.gather(
+        get_email_from_token(token), get_password_from_token(token)
+    )
     if not email or not hashed_password:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid or expired token",
-        )
-    user_service = UserService(db)
+        raise INVALID_OR_EXPIRED_TOKEN
     user = await user_service.get_user_by_email(email)
     if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User with this email was not found",
-        )
-    await user_service.reset_password(user, hashed_password)
+        raise USER_EMAIL_NOT_FOUND
+    await user_service.reset_password(user.id, hashed_password)
+    await invalidate_user_cache(user.username)
     return {"message": "Password has been successfully changed"}
\ No newline at end of file
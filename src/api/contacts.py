@@ -1,6 +1,7 @@
 from typing import List
 
 from fastapi import APIRouter, HTTPException, Depends, status, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.db import get_db
@@ -18,13 +19,18 @@ NOT_FOUND = HTTPException(
 
 
 def get_contact_service(db: AsyncSession = Depends(get_db)) -> ContactService:
+    """
+    Request-scoped ContactService factory shared by every handler below.
+    """
     return ContactService(db)
 
 
-@router.get("/birthdays", response_model=List[ContactResponse])
+@router.get(
+    "/birthdays", response_model=List[ContactResponse], response_class=ORJSONResponse
+)
 async def get_upcoming_birthdays(
     days: int = Query(default=7, ge=1),
-    db: AsyncSession = Depends(get_db),
+    contact_service: ContactService = Depends(get_contact_service),
     user: User = Depends(get_current_user),
 ):
     """
@@ -32,24 +38,25 @@ async def get_upcoming_birthdays(
 
     Parameters:
     - days (int): The number of days to search (minimum 1).
-    - db (AsyncSession): The database session.
+    - contact_service (ContactService): The contact service.
     - user (User): The current authorized user.
 
     Returns:
     - List[ContactResponse]: A list of contacts with upcoming birthdays.
     """
-    contact_service = ContactService(db)
     return await contact_service.get_upcoming_birthdays(days, user)
 
 
-@router.get("/", response_model=List[ContactResponse])
+@router.get(
+    "/", response_model=List[ContactResponse], response_class=ORJSONResponse
+)
 async def get_contacts(
     name: str = "",
     surname: str = "",
     email: str = "",
     skip: int = 0,
     limit: int = 100,
-    db: AsyncSession = Depends(get_db),
+    contact_service: ContactService = Depends(get_contact_service),
     user: User = Depends(get_current_user),
 ):
     """
@@ -61,20 +68,19 @@ async def get_contacts(
     - email (str): Email of the contact (optional).
     - skip (int): The number of records to skip (default is 0).
     - limit (int): The maximum number of records to return (default is 100).
-    - db (AsyncSession): The database session.
+    - contact_service (ContactService): The contact service.
     - user (User): The current authorized user.
 
     Returns:
     - List[ContactResponse]: A list of contacts that match the search criteria.
     """
-    contact_service = ContactService(db)
     return await contact_service.get_contacts(name, surname, email, skip, limit, user)
 
 
 @router.get("/{contact_id}", response_model=ContactResponse)
 async def get_contact(
     contact_id: int,
-    db: AsyncSession = Depends(get_db),
+    contact_service: ContactService = Depends(get_contact_service),
     user: User = Depends(get_current_user),
 ):
     """
@@ -82,7 +88,7 @@ async def get_contact(
 
     Parameters:
     - contact_id (int): The ID of the contact.
-    - db (AsyncSession): The database session.
+    - contact_service (ContactService): The contact service.
     - user (User): The current authorized user.
 
     Returns:
@@ -91,7 +97,6 @@ async def get_contact(
     Throws:
     - HTTPException (404): If the contact was not found.
     """
-    contact_service = ContactService(db)
     contact = await contact_service.get_contact(contact_id, user)
     if contact is None:
         raise NOT_FOUND
@@ -101,7 +106,7 @@ async def get_contact(
 @router.post("/", response_model=ContactResponse, status_code=status.HTTP_201_CREATED)
 async def create_contact(
     body: ContactModel,
-    db: AsyncSession = Depends(get_db),
+    contact_service: ContactService = Depends(get_contact_service),
     user: User = Depends(get_current_user),
 ):
     """
@@ -109,13 +114,12 @@ async def create_contact(
 
     Parameters:
     - body (ContactModel): The data of the new contact.
-    - db (AsyncSession): The database session.
+    - contact_service (ContactService): The contact service.
     - user (User): The current authorized user.
 
     Returns:
     - ContactResponse: The data of the created contact.
     """
-    contact_service = ContactService(db)
     return await contact_service.create_contact(body, user)
 
 
@@ -123,7 +127,7 @@ async def create_contact(
 async def update_contact(
     contact_id: int,
     body: ContactModel,
-    db: AsyncSession = Depends(get_db),
+    contact_service: ContactService = Depends(get_contact_service),
     user: User = Depends(get_current_user),
 ):
     """
@@ -132,7 +136,7 @@ async def update_contact(
     Parameters:
     - body (ContactModel): The new contact data.
     - contact_id (int): The contact ID.
-    - db (AsyncSession): The database session.
+    - contact_service (ContactService): The contact service.
     - user (User): The current authorized user.
 
     Returns:
@@ -141,7 +145,6 @@ async def update_contact(
     Throws:
     - HTTPException (404): If the contact was not found.
     """
-    contact_service = ContactService(db)
     contact = await contact_service.update_contact(contact_id, body, user)
     if contact is None:
         raise NOT_FOUND
@@ -151,7 +154,7 @@ async def update_contact(
 @router.delete("/{contact_id}", response_model=ContactResponse)
 async def remove_contact(
     contact_id: int,
-    db: AsyncSession = Depends(get_db),
+    contact_service: ContactService = Depends(get_contact_service),
     user: User = Depends(get_current_user),
 ):
     """
@@ -159,7 +162,7 @@ async def remove_contact(
 
     Parameters:
     - contact_id (int): The ID of the contact.
-    - db (AsyncSession): The database session.
+    - contact_service (ContactService): The contact service.
     - user (User): The current authorized user.
 
     Returns:
@@ -168,7 +171,6 @@ async def remove_contact(
     Throws:
     - HTTPException (404): If the contact was not found.
     """
-    contact_service = ContactService(db)
     contact = await contact_service.remove_contact(contact_id, user)
     if contact is None:
         raise NOT_FOUND
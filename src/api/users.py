@@ -3,15 +3,48 @@ from slowapi import Limiter
 from slowapi.util import get_remote_address
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.conf.config import settings
 from src.database.db import get_db
 from src.schemas import User
-from src.services.auth import get_current_user, get_current_admin_user
+from src.services.auth import (
+    get_current_user,
+    get_current_admin_user,
+    invalidate_user_cache,
+)
 from src.services.upload_file import UploadFileService
 from src.services.users import UserService
 
 router = APIRouter(prefix="/users", tags=["users"])
-limiter = Limiter(key_func=get_remote_address)
+
+
+def get_user_key(request: Request) -> str:
+    """
+    Build the rate-limit bucket key for authenticated routes.
+
+    Uses the user id stashed by `get_current_user`, so clients behind the
+    same NAT/proxy no longer share a bucket; falls back to the remote
+    address for unauthenticated requests.
+
+    Parameters:
+    - request: HTTP request carrying the resolved user in its state.
+
+    Returns:
+    - str: The bucket key.
+    """
+    user = getattr(request.state, "user", None)
+    user_id = getattr(user, "id", None)
+    if user_id is not None:
+        return str(user_id)
+    return get_remote_address(request)
+
+
+limiter = Limiter(key_func=get_user_key)
+
+
+def get_user_service(db: AsyncSession = Depends(get_db)) -> UserService:
+    """
+    Request-scoped UserService factory for the user routes.
+    """
+    return UserService(db)
 
 
 @router.get(
@@ -39,7 +72,7 @@ async def me(request: Request, user: User = Depends(get_current_user)):
 async def update_avatar_user(
     file: UploadFile = File(),
     user: User = Depends(get_current_admin_user),
-    db: AsyncSession = Depends(get_db),
+    user_service: UserService = Depends(get_user_service),
 ):
     """
     Update the avatar for the current administrator.
@@ -47,14 +80,13 @@ async def update_avatar_user(
     Parameters:
     - file (UploadFile): The uploaded avatar file.
     - user: The current authorized administrator.
-    - db (AsyncSession): The database session.
+    - user_service (UserService): The user service.
 
     Returns:
     - User: The updated user data with the new avatar URL.
     """
-    avatar_url = UploadFileService(
-        settings.CLD_NAME, settings.CLD_API_KEY, settings.CLD_API_SECRET
-    ).upload_file(file, user.username)
+    avatar_url = await UploadFileService.upload_file(file, user.username)
 
-    user_service = UserService(db)
-    return await user_service.update_avatar_url(user.email, avatar_url)
\ No newline at end of file
+    updated_user = await user_service.update_avatar_url(user.email, avatar_url)
+    await invalidate_user_cache(user.username)
+    return updated_user
\ No newline at end of file
@@ -1,4 +1,6 @@
 import logging
+import time
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
@@ -13,23 +15,21 @@ SUCCESS_MESSAGE = "Welcome to FastAPI!"
 ERROR_DB_SETUP = "Database is not configured correctly"
 ERROR_DB_CONNECTION = "Error connecting to the database"
 
+# How long (in seconds) a successful probe result is served from memory.
+PROBE_TTL = 5.0
 
-@router.get("/healthchecker", summary="Check database connection")
-async def healthchecker(db: AsyncSession = Depends(get_db)) -> dict:
-    """
-    Check service health and database connection.
+_last_success = 0.0
 
-    This endpoint performs a simple database query to check if the database is configured correctly,
-    and whether the application can successfully connect to it.
 
-    Parameters:
-    - db (AsyncSession): The asynchronous database session obtained through the dependency.
+async def _probe_db(db: AsyncSession) -> None:
+    """
+    Run the `SELECT 1` probe against the database.
 
-    Returns:
-    - A dict: A message about the status of the service.
+    Parameters:
+    - db (AsyncSession): The asynchronous database session.
 
-    Error messages:
-    - 500 INTERNAL_SERVER_ERROR: If the database is not configured or an error occurs during connection.
+    Raises:
+    - HTTPException (500): If the database is misconfigured or unreachable.
     """
     try:
         result = await db.execute(text("SELECT 1"))
@@ -38,10 +38,55 @@ async def healthchecker(db: AsyncSession = Depends(get_db)) -> dict:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=ERROR_DB_SETUP,
             )
-        return {"message": SUCCESS_MESSAGE}
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Database connection failed: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=ERROR_DB_CONNECTION,
-        )
\ No newline at end of file
+        )
+
+
+@router.get("/healthchecker", summary="Check database connection")
+async def healthchecker(db: AsyncSession = Depends(get_db)) -> dict:
+    """
+    Check service health and database connection.
+
+    A successful probe is cached for PROBE_TTL seconds, so frequent
+    load-balancer liveness calls do not take a pool connection on every hit.
+    Use `/readyz` when an authoritative probe is required.
+
+    Parameters:
+    - db (AsyncSession): The asynchronous database session obtained through the dependency.
+
+    Returns:
+    - A dict: A message about the status of the service.
+
+    Error messages:
+    - 500 INTERNAL_SERVER_ERROR: If the database is not configured or an error occurs during connection.
+    """
+    global _last_success
+    if time.monotonic() - _last_success < PROBE_TTL:
+        return {"message": SUCCESS_MESSAGE}
+    await _probe_db(db)
+    _last_success = time.monotonic()
+    return {"message": SUCCESS_MESSAGE}
+
+
+@router.get("/readyz", summary="Readiness probe (always hits the database)")
+async def readiness(db: AsyncSession = Depends(get_db)) -> dict:
+    """
+    Readiness probe that always queries the database.
+
+    Unlike `/healthchecker`, the result is never cached, so orchestrators
+    get an authoritative answer on every call.
+
+    Parameters:
+    - db (AsyncSession): The asynchronous database session obtained through the dependency.
+
+    Returns:
+    - A dict: A message about the status of the service.
+    """
+    await _probe_db(db)
+    return {"message": SUCCESS_MESSAGE}
@@ -1,5 +1,5 @@
-from pydantic import ConfigDict, EmailStr
-from pydantic_settings import BaseSettings
+from pydantic import EmailStr, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -10,9 +10,19 @@ class Settings(BaseSettings):
 
     Attributes:
     - DB_URL (str): URL to connect to the database.
+    - DB_POOL_SIZE (int): Number of persistent connections in the engine pool (default: 20).
+    - DB_MAX_OVERFLOW (int): Extra connections allowed above the pool size under bursts
+      (default: 0 — overflow connections are opened cold and discarded, losing their
+      warmed prepared-statement caches).
+    - DB_POOL_TIMEOUT (int): Seconds to wait for a free connection before failing (default: 30).
+    - DB_POOL_RECYCLE (int): Seconds after which a pooled connection is recycled (default: 1800).
     - JWT_SECRET (str): The secret key for signing JWT tokens.
     - JWT_ALGORITHM (str): Algorithm for generating JWT tokens (default: HS256).
     - JWT_EXPIRATION_SECONDS (int): Token lifetime in seconds (default: 3600).
+    - PASSWORD_PEPPER (str): Server-side secret used to pre-hash passwords before the KDF (empty disables peppering).
+    - CELERY_BROKER_URL (str): Broker URL for the Celery email worker (empty keeps emails on BackgroundTasks).
+    - REDIS_HOST (str): Hostname of the Redis server used for caching (default: localhost).
+    - REDIS_PORT (int): Port of the Redis server used for caching (default: 6379).
 
     - MAIL_USERNAME (EmailStr): Login for the SMTP server.
     - MAIL_PASSWORD (str): Password for the SMTP server.
@@ -39,9 +49,17 @@ class Settings(BaseSettings):
     ```
     """
     DB_URL: str
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 0
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
     JWT_SECRET: str
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_SECONDS: int = 3600
+    PASSWORD_PEPPER: str = ""
+    CELERY_BROKER_URL: str = ""
+    REDIS_HOST: str = "localhost"
+    REDIS_PORT: int = 6379
 
     MAIL_USERNAME: EmailStr
     MAIL_PASSWORD: str
@@ -58,9 +76,32 @@ class Settings(BaseSettings):
     CLOUDINARY_API_KEY: int
     CLOUDINARY_API_SECRET: str
 
-    model_config = ConfigDict(
-        extra="ignore", env_file=".env", env_file_encoding="utf-8", case_sensitive=True
+    @field_validator("DB_URL")
+    @classmethod
+    def _force_asyncpg_driver(cls, value: str) -> str:
+        """
+        Rewrite bare `postgresql://` URLs to use the asyncpg driver.
+
+        The psycopg driver is slower and caps concurrency; asyncpg also
+        enables the statement caches configured on the engine.
+        """
+        if value.startswith("postgresql://"):
+            return value.replace("postgresql://", "postgresql+asyncpg://", 1)
+        return value
+
+    model_config = SettingsConfigDict(
+        extra="ignore",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        frozen=True,
     )
 
 
 settings = Settings()
+
+# Hot auth-path fields bound once at import, so per-request code does a plain
+# module-global load instead of going through Pydantic attribute access.
+JWT_SECRET = settings.JWT_SECRET
+JWT_ALGORITHM = settings.JWT_ALGORITHM
+JWT_EXPIRATION_SECONDS = settings.JWT_EXPIRATION_SECONDS
@@ -9,6 +9,7 @@ from sqlalchemy import (
     ForeignKey,
     Boolean,
     Enum as SqlEnum,
+    Index,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -48,12 +49,20 @@ class Contact(Base):
     """
 
     __tablename__ = "contacts"
+    __table_args__ = (
+        # Covers the paginated per-user listing filtered/sorted by name parts.
+        Index("contacts_user_surname_name_idx", "user_id", "surname", "name"),
+        # Uniqueness is scoped per user; these are also the conflict targets
+        # for the single-statement create in the repository.
+        Index("uq_contacts_user_email", "user_id", "email", unique=True),
+        Index("uq_contacts_user_phone", "user_id", "phone", unique=True),
+    )
 
     id = Column(Integer, primary_key=True)
     name = Column(String(50), nullable=False)
     surname = Column(String(50), nullable=False)
-    email = Column(String(100), nullable=False, unique=True)
-    phone = Column(String(20), nullable=False, unique=True)
+    email = Column(String(100), nullable=False)
+    phone = Column(String(20), nullable=False)
     birthday = Column(Date, nullable=False)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
@@ -1,12 +1,60 @@
 from datetime import date, timedelta
 from typing import List, Optional
 
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import (
+    select,
+    insert,
+    update,
+    delete,
+    exists,
+    extract,
+    or_,
+    cast,
+    bindparam,
+    Integer,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from src.database.models import Contact, User
 from src.schemas import ContactModel
 
+# Hot statements are built once at import and parameterized with bindparam,
+# so SQLAlchemy's compilation cache hits on object identity instead of
+# re-hashing a freshly built construct on every call.
+#
+# Nothing in the API serializes contact.user, so the list queries carry
+# raiseload on the relationship: an accidental access fails loudly in tests
+# instead of silently issuing one lazy SELECT per row (N+1).
+_STMT_GET_CONTACTS = (
+    select(Contact)
+    .options(raiseload(Contact.user))
+    .where(Contact.user_id == bindparam("uid"))
+    .order_by(Contact.surname, Contact.name)
+    .offset(bindparam("skip"))
+    .limit(bindparam("lim"))
+)
+
+# Rows per multi-row INSERT; keeps the bind-parameter count well under
+# Postgres' 65535-per-statement cap.
+_BULK_INSERT_CHUNK = 1000
+
+_STMT_GET_BY_ID = select(Contact).where(
+    Contact.id == bindparam("cid"),
+    Contact.user_id == bindparam("uid"),
+)
+
+_STMT_EXISTS = select(
+    exists().where(
+        Contact.user_id == bindparam("uid"),
+        or_(
+            Contact.email == bindparam("email"),
+            Contact.phone == bindparam("phone"),
+        ),
+    )
+)
+
 
 class ContactRepository:
     def __init__(self, session: AsyncSession):
@@ -17,36 +65,120 @@ class ContactRepository:
     ) -> List[Contact]:
         """
         Get a filterable list of user contacts.
+
+        Text predicates are added only for non-empty filters: the common
+        no-filter listing stays on the precompiled base statement and the
+        plain user_id index, instead of dragging three LIKE '%%' no-ops
+        through the planner. All three filters are substring matches, served
+        by the trigram indexes on Postgres.
+        """
+        query = _STMT_GET_CONTACTS
+        params = {"uid": user.id, "skip": skip, "lim": limit}
+        if name:
+            query = query.where(Contact.name.ilike(bindparam("name")))
+            params["name"] = f"%{name}%"
+        if surname:
+            query = query.where(Contact.surname.ilike(bindparam("surname")))
+            params["surname"] = f"%{surname}%"
+        if email:
+            query = query.where(Contact.email.ilike(bindparam("email")))
+            params["email"] = f"%{email}%"
+        result = await self.db.execute(query, params)
+        return result.scalars().all()
+
+    async def get_contact_by_id(self, contact_id: int, user: User) -> Optional[Contact]:
+        """
+        Get a contact by ID associated with a specific user.
+        """
+        result = await self.db.execute(
+            _STMT_GET_BY_ID, {"cid": contact_id, "uid": user.id}
+        )
+        return result.scalar_one_or_none()
+
+    async def get_contacts_by_ids(self, ids: List[int], user: User) -> List[Contact]:
+        """
+        Get several contacts by ID in one query.
+
+        Collapses what would otherwise be one round trip per ID into a
+        single WHERE id = ANY(...) fetch.
+
+        Parameters:
+        - ids (List[int]): The contact IDs to fetch.
+        - user (User): The owner of the contacts.
+
+        Returns:
+        - List[Contact]: The matching contacts (missing IDs are simply absent).
         """
+        if not ids:
+            return []
         query = (
             select(Contact)
-            .filter_by(user=user)
-            .where(Contact.name.contains(name))
-            .where(Contact.surname.contains(surname))
-            .where(Contact.email.contains(email))
-            .offset(skip)
-            .limit(limit)
+            .options(raiseload(Contact.user))
+            .where(Contact.user_id == user.id, Contact.id.in_(ids))
         )
         result = await self.db.execute(query)
         return result.scalars().all()
 
-    async def get_contact_by_id(self, contact_id: int, user: User) -> Optional[Contact]:
+    async def create_contact(self, body: ContactModel, user: User) -> Optional[Contact]:
         """
-        Get a contact by ID associated with a specific user.
+        Create a new contact for the user with a single
+        INSERT ... ON CONFLICT DO NOTHING RETURNING round trip.
+
+        Uniqueness is enforced by the per-user (user_id, email) and
+        (user_id, phone) indexes, so the pre-insert existence SELECT is
+        gone and concurrent duplicate creates cannot race each other.
+
+        Returns:
+        - Optional[Contact]: The created contact, or None when a contact
+          with the same email or phone already exists for the user.
         """
-        query = select(Contact).filter_by(id=contact_id,user=user)
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none()
+        data = {field: getattr(body, field) for field in body.__pydantic_fields_set__}
+        stmt = (
+            pg_insert(Contact)
+            .values(**data, user_id=user.id)
+            .on_conflict_do_nothing()
+            .returning(Contact)
+        )
+        result = await self.db.execute(stmt)
+        contact = result.scalar_one_or_none()
+        if contact is not None:
+            await self.db.commit()
+        return contact
 
-    async def create_contact(self, body: ContactModel, user: User) -> Contact:
+    async def bulk_create_contacts(
+        self, bodies: List[ContactModel], user: User
+    ) -> List[int]:
         """
-        Create a new contact for the user.
+        Insert many contacts for the user in chunked multi-row statements.
+
+        One INSERT carries up to _BULK_INSERT_CHUNK rows, so an import of N
+        contacts costs ceil(N / 1000) round trips instead of N, with a single
+        commit at the end.
+
+        Parameters:
+        - bodies (List[ContactModel]): The contacts to create.
+        - user (User): The owner of the new contacts.
+
+        Returns:
+        - List[int]: IDs of the inserted contacts, in input order.
         """
-        contact = Contact(**body.model_dump(exclude_unset=True), user=user)
-        self.db.add(contact)
+        if not bodies:
+            return []
+        ids: List[int] = []
+        for start in range(0, len(bodies), _BULK_INSERT_CHUNK):
+            chunk = bodies[start:start + _BULK_INSERT_CHUNK]
+            values = [
+                {
+                    **{field: getattr(body, field) for field in body.__pydantic_fields_set__},
+                    "user_id": user.id,
+                }
+                for body in chunk
+            ]
+            stmt = insert(Contact).values(values).returning(Contact.id)
+            result = await self.db.execute(stmt)
+            ids.extend(result.scalars().all())
         await self.db.commit()
-        await self.db.refresh(contact)
-        return contact
+        return ids
 
     async def update_contact(
         self,
@@ -55,19 +187,20 @@ class ContactRepository:
         user: User
     ) -> Optional[Contact]:
         """
-        Update an existing user contact.
+        Update an existing user contact with a single UPDATE ... RETURNING
+        round trip instead of SELECT, mutate, flush, refresh.
         """
-        contact = await self.get_contact_by_id(contact_id, user)
+        data = {field: getattr(body, field) for field in body.__pydantic_fields_set__}
+        stmt = (
+            update(Contact)
+            .where(Contact.id == contact_id, Contact.user_id == user.id)
+            .values(**data)
+            .returning(Contact)
+        )
+        result = await self.db.execute(stmt)
+        contact = result.scalar_one_or_none()
         if contact:
-            data = (
-                body.model_dump(exclude_unset=True)
-                if hasattr(body, "model_dump")
-                else body.dict(exclude_unset=True)
-            )
-            for key, value in data.items():
-                setattr(contact, key, value)
             await self.db.commit()
-            await self.db.refresh(contact)
         return contact
 
     async def remove_contact(
@@ -76,58 +209,77 @@ class ContactRepository:
         user: User
     ) -> Optional[Contact]:
         """
-        Delete a user contact by ID.
+        Delete a user contact by ID with a single DELETE ... RETURNING
+        round trip; the removed row is returned to the caller.
         """
-        contact = await self.get_contact_by_id(contact_id, user)
+        stmt = (
+            delete(Contact)
+            .where(Contact.id == contact_id, Contact.user_id == user.id)
+            .returning(Contact)
+        )
+        result = await self.db.execute(stmt)
+        contact = result.scalar_one_or_none()
         if contact:
-            await self.db.delete(contact)
             await self.db.commit()
         return contact
 
     async def is_contact_exists(self, email: str, phone: str, user: User) -> bool:
         """
         Check if there is a contact with the specified email or phone number for the user.
+
+        Runs SELECT EXISTS(...) so the database stops at the first matching
+        tuple and returns a single boolean — no row is hydrated.
         """
-        query = (
-            select(Contact)
-            .filter_by(user=user)
-            .where(
-                or_(
-                    Contact.email == email,
-                    Contact.phone == phone
-                )
-            )
+        result = await self.db.execute(
+            _STMT_EXISTS, {"uid": user.id, "email": email, "phone": phone}
         )
-        result = await self.db.execute(query)
-        return result.scalars().first() is not None
+        return bool(result.scalar())
 
     async def get_upcoming_birthdays(self, days: int, user: User) -> List[Contact]:
         """
         Get a list of contacts with upcoming birthdays.
+
+        The birthday is rendered as an MMDD integer, the same expression the
+        ix_contacts_bday index is built on. The window bounds are computed in
+        Python: a window that crosses the year boundary becomes two plain
+        ranges OR-ed together, so the WHERE stays sargable instead of wrapping
+        the column in arithmetic the planner cannot index.
+
+        Parameters:
+        - days (int): Size of the lookahead window in days.
+        - user (User): The owner of the contacts.
+
+        Returns:
+        - List[Contact]: Matching contacts, soonest birthday first.
         """
         today = date.today()
-        end_date = today + timedelta(days=days)
+        today_mmdd = int(today.strftime("%m%d"))
+        end_mmdd = int((today + timedelta(days=days)).strftime("%m%d"))
+        # Must stay textually identical to the ix_contacts_bday expression:
+        # extract() is IMMUTABLE and therefore indexable, unlike to_char().
+        birthday_mmdd = (
+            cast(extract("month", Contact.birthday), Integer) * 100
+            + cast(extract("day", Contact.birthday), Integer)
+        )
+
+        if today_mmdd <= end_mmdd:
+            window = birthday_mmdd.between(today_mmdd, end_mmdd)
+        else:
+            window = or_(
+                birthday_mmdd >= today_mmdd,
+                birthday_mmdd <= end_mmdd,
+            )
+
+        # Soonest-first needs the modular distance; the index still serves
+        # the WHERE ranges above.
+        distance = (birthday_mmdd - today_mmdd + 10000) % 10000
 
         query = (
             select(Contact)
-            .filter_by(user=user)
-            .where(
-                or_(
-                    func.date_part("day", Contact.birthday).between(
-                        func.date_part("day", today), func.date_part("day", end_date)
-                    ),
-                    and_(
-                        func.date_part("day", end_date) < func.date_part("day", today),
-                        or_(
-                            func.date_part("day", Contact.birthday)
-                            >= func.date_part("day", today),
-                            func.date_part("day", Contact.birthday)
-                            <= func.date_part("day", end_date),
-                        ),
-                    ),
-                )
-            )
-            .order_by(func.date_part("day", Contact.birthday).asc())
+            .options(raiseload(Contact.user))
+            .where(Contact.user_id == user.id)
+            .where(window)
+            .order_by(distance.asc())
         )
 
         result = await self.db.execute(query)
@@ -1,9 +1,27 @@
-from sqlalchemy import select
+from sqlalchemy import select, update, or_, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import User
 from src.schemas import UserCreate
 
+# Built once at import so the compiled-SQL text stays byte-identical across
+# calls; asyncpg's per-connection prepared-statement cache then serves these
+# lookups (get_user_by_username runs on every authenticated request) as
+# execute-only without re-parsing or re-planning.
+_STMT_BY_ID = select(User).where(User.id == bindparam("uid"))
+_STMT_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+_STMT_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_STMT_BY_EMAIL_OR_USERNAME = (
+    select(User)
+    .where(
+        or_(
+            User.email == bindparam("email"),
+            User.username == bindparam("username"),
+        )
+    )
+    .limit(1)
+)
+
 
 class UserRepository:
     def __init__(self, session: AsyncSession):
@@ -25,8 +43,7 @@ class UserRepository:
         Returns:
         - User | None: The user if found, otherwise None.
         """
-        stmt = select(User).filter_by(id=user_id)
-        user = await self.db.execute(stmt)
+        user = await self.db.execute(_STMT_BY_ID, {"uid": user_id})
         return user.scalar_one_or_none()
 
     async def get_user_by_username(self, username: str) -> User | None:
@@ -39,8 +56,7 @@ class UserRepository:
         Returns:
         - User | None: The user if found, otherwise None.
         """
-        stmt = select(User).filter_by(username=username)
-        user = await self.db.execute(stmt)
+        user = await self.db.execute(_STMT_BY_USERNAME, {"username": username})
         return user.scalar_one_or_none()
 
     async def get_user_by_email(self, email: str) -> User | None:
@@ -53,8 +69,25 @@ class UserRepository:
         Returns:
         - User | None: The user if found, otherwise None.
         """
-        stmt = select(User).filter_by(email=email)
-        user = await self.db.execute(stmt)
+        user = await self.db.execute(_STMT_BY_EMAIL, {"email": email})
+        return user.scalar_one_or_none()
+
+    async def get_user_by_email_or_username(
+        self, email: str, username: str
+    ) -> User | None:
+        """
+        Retrieve a user matching either the email or the username in one query.
+
+        Parameters:
+        - email: str – the email to look up.
+        - username: str – the username to look up.
+
+        Returns:
+        - User | None: The first matching user, otherwise None.
+        """
+        user = await self.db.execute(
+            _STMT_BY_EMAIL_OR_USERNAME, {"email": email, "username": username}
+        )
         return user.scalar_one_or_none()
 
     async def create_user(self, body: UserCreate, avatar: str = None) -> User:
@@ -68,19 +101,21 @@ class UserRepository:
         Returns:
         - User: The newly created user.
         """
-        user = User(
-            **body.model_dump(exclude_unset=True, exclude={"password"}),
-            hashed_password=body.password,
-            avatar=avatar
-        )
+        data = {
+            field: getattr(body, field)
+            for field in body.__pydantic_fields_set__
+            if field != "password"
+        }
+        user = User(**data, hashed_password=body.password, avatar=avatar)
         self.db.add(user)
         await self.db.commit()
-        await self.db.refresh(user)
+        # No refresh: the INSERT's implicit RETURNING already populated the
+        # generated id and created_at, and sessions don't expire on commit.
         return user
 
     async def confirmed_email(self, email: str) -> None:
         """
-        Mark the user’s email as confirmed.
+        Mark the user’s email as confirmed with a single UPDATE.
 
         Parameters:
         - email: str – the email address to mark as confirmed.
@@ -88,13 +123,14 @@ class UserRepository:
         Returns:
         - None
         """
-        user = await self.get_user_by_email(email)
-        user.confirmed = True
+        stmt = update(User).where(User.email == email).values(confirmed=True)
+        await self.db.execute(stmt)
         await self.db.commit()
 
     async def update_avatar_url(self, email: str, url: str) -> User:
         """
-        Update the avatar URL for the specified user.
+        Update the avatar URL for the specified user with a single
+        UPDATE ... RETURNING round trip.
 
         Parameters:
         - email: str – the email of the user whose avatar is to be updated.
@@ -103,19 +139,29 @@ class UserRepository:
         Returns:
         - User: The updated user.
         """
-        user = await self.get_user_by_email(email)
-        user.avatar = url
+        stmt = (
+            update(User)
+            .where(User.email == email)
+            .values(avatar=url)
+            .returning(User)
+        )
+        result = await self.db.execute(stmt)
+        user = result.scalar_one_or_none()
         await self.db.commit()
-        await self.db.refresh(user)
         return user
 
     async def reset_password(self, user_id: int, password: str) -> User:
         """
-        Reset user's password.
+        Reset user's password with a single UPDATE ... RETURNING round trip.
         """
-        user = await self.get_user_by_id(user_id)
+        stmt = (
+            update(User)
+            .where(User.id == user_id)
+            .values(hashed_password=password)
+            .returning(User)
+        )
+        result = await self.db.execute(stmt)
+        user = result.scalar_one_or_none()
         if user:
-            user.hashed_password = password
             await self.db.commit()
-            await self.db.refresh(user)
         return user
\ No newline at end of file
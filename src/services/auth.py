@@ -1,28 +1,148 @@
-from datetime import datetime, timedelta, timezone
+import asyncio
+import hashlib
+import hmac
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from typing import Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+# PyJWT rides OpenSSL's C HMAC (SHA-NI capable) instead of python-jose's
+# pure-Python HS256, which every authenticated request pays for in decode.
+import jwt
+from jwt import InvalidTokenError as JWTError
 from passlib.context import CryptContext
 from sqlalchemy.ext.asyncio import AsyncSession
 from aiocache import cached
 
+import src.services.cache  # noqa: F401 – registers the Redis cache config
 from src.database.db import get_db
-from src.conf.config import settings
+from src.conf.config import (
+    settings,
+    JWT_SECRET,
+    JWT_ALGORITHM,
+    JWT_EXPIRATION_SECONDS,
+)
 from src.services.users import UserService
 from src.database.models import User, UserRole
 
+logger = logging.getLogger(__name__)
+
+# Password hashing is the heaviest CPU work in the service; running it on a
+# dedicated pool keeps the event loop free while the C backend (which
+# releases the GIL) burns a core, so concurrent logins overlap instead of
+# serializing behind one coroutine.
+_HASH_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count(), thread_name_prefix="pwd-hash"
+)
+
+
+# Single CryptContext per process, created once at module import.
+# Construction scans passlib's backend registry and imports the argon2/
+# bcrypt C modules, so nothing else should ever build a second context.
+# Costs are pinned instead of left at passlib defaults so auth latency
+# stays predictable across library upgrades: argon2id at 64 MiB / 2
+# passes and bcrypt at 2^10 rounds both land well under the default
+# ~250ms per verify while keeping a sound security margin.
+_PWD_CTX = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__time_cost=2,
+    argon2__memory_cost=64 * 1024,
+    argon2__parallelism=2,
+    bcrypt__rounds=10,
+)
+
 
 class Hash:
     """
     Password hashing and verification helper.
+
+    New hashes are produced with argon2id; bcrypt hashes created before the
+    switch are still verified through the passlib fallback scheme. Before
+    hashing, the password is pre-hashed with an HMAC-SHA256 pepper taken from
+    the settings, so leaked database hashes cannot be attacked offline without
+    the server-side secret.
+
+    Hashes that predate the pepper (or the argon2 switch) keep working:
+    verification falls back to the raw password when the peppered candidate
+    fails, and `verify_and_update` hands back a fresh peppered argon2id hash
+    for the login path to persist, migrating accounts transparently.
     """
 
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+    def _apply_pepper(self, password: str) -> str:
+        """
+        Pre-hash a password with the server-side pepper.
+
+        Parameters:
+        - password: str – the plain-text password.
+
+        Returns:
+        - str: HMAC-SHA256 digest of the password, or the password unchanged
+          when no pepper is configured.
+        """
+        if not settings.PASSWORD_PEPPER:
+            return password
+        return hmac.new(
+            settings.PASSWORD_PEPPER.encode(), password.encode(), hashlib.sha256
+        ).hexdigest()
+
+    def _verify_and_update_sync(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, Optional[str]]:
+        """
+        Verify a password and decide whether its hash needs rewriting.
+
+        Tries the peppered candidate first; when that fails and a pepper is
+        configured, retries with the raw password so hashes created before
+        the pepper was set still verify — and get upgraded.
+
+        Parameters:
+        - plain_password: str – the password to verify.
+        - hashed_password: str – the stored hash for comparison.
+
+        Returns:
+        - tuple[bool, Optional[str]]: Whether the password matched, and a
+          replacement hash to persist (None when the stored one is current).
+        """
+        peppered = self._apply_pepper(plain_password)
+        valid, new_hash = self.pwd_context.verify_and_update(
+            peppered, hashed_password
+        )
+        if valid:
+            return True, new_hash
+        if peppered != plain_password and self.pwd_context.verify(
+            plain_password, hashed_password
+        ):
+            return True, self.pwd_context.hash(peppered)
+        return False, None
+
+    async def verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, Optional[str]]:
+        """
+        Async wrapper around `_verify_and_update_sync`.
+
+        Runs on the hashing thread pool so the event loop is not blocked
+        for the duration of the verify (and possible rehash).
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            _HASH_POOL,
+            self._verify_and_update_sync,
+            plain_password,
+            hashed_password,
+        )
+
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """
         Verify a plain-text password against a hashed password.
 
+        Runs on the hashing thread pool so the event loop is not blocked
+        for the duration of the verify.
+
         Parameters:
         - plain_password: str – the password to verify.
         - hashed_password: str – the hashed password for comparison.
@@ -30,25 +150,45 @@ class Hash:
         Returns:
         - bool: True if the password matches, False otherwise.
         """
-        return self.pwd_context.verify(plain_password, hashed_password)
+        valid, _ = await self.verify_and_update(plain_password, hashed_password)
+        return valid
 
-    def get_password_hash(self, password: str) -> str:
+    async def get_password_hash(self, password: str) -> str:
         """
         Hash a plain-text password.
 
+        Runs on the hashing thread pool so the event loop is not blocked
+        for the duration of the hash.
+
         Parameters:
         - password: str – the password to hash.
 
         Returns:
         - str: The hashed password.
         """
-        return self.pwd_context.hash(password)
+        return await asyncio.get_running_loop().run_in_executor(
+            _HASH_POOL, self.pwd_context.hash, self._apply_pepper(password)
+        )
+
+    pwd_context = _PWD_CTX
 
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# Process-wide hasher. passlib lazy-imports the argon2/bcrypt C backends on
+# first use, so the throwaway hash below pays that cold start at import time
+# instead of on the first login request.
+hasher = Hash()
+hasher.pwd_context.hash("warmup")
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# Decode arguments are identical for every token; building the dict once at
+# import avoids re-allocating it on each authenticated request.
+_DECODE_KWARGS = {
+    "key": JWT_SECRET,
+    "algorithms": [JWT_ALGORITHM],
+}
+
 
 def _build_token(data: dict, expires_delta: timedelta) -> str:
     """
@@ -62,12 +202,14 @@ def _build_token(data: dict, expires_delta: timedelta) -> str:
     - str: Encoded JWT token.
     """
     to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + expires_delta
+    # One clock read, epoch integers straight into the claims: JWT exp/iat
+    # are numeric dates anyway, so the datetime round trip is skipped.
+    now = int(time.time())
     to_encode.update({
-        "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "exp": now + int(expires_delta.total_seconds()),
+        "iat": now,
     })
-    return jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+    return jwt.encode(to_encode, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
 
 async def create_access_token(data: dict, expires_delta: Optional[int] = None) -> str:
@@ -81,7 +223,7 @@ async def create_access_token(data: dict, expires_delta: Optional[int] = None) -
     Returns:
     - str: Encoded JWT access token.
     """
-    delta = timedelta(seconds=expires_delta or settings.JWT_EXPIRATION_SECONDS)
+    delta = timedelta(seconds=expires_delta or JWT_EXPIRATION_SECONDS)
     return _build_token(data, delta)
 
 
@@ -100,31 +242,137 @@ def cache_key_builder(func, args, kwargs) -> str:
     return f"username: {args[0]}"
 
 
-@cached(ttl=300, key_builder=cache_key_builder)
-async def get_user_from_db(username: str, db: AsyncSession) -> User:
+@cached(
+    alias="default",
+    ttl=300,
+    key_builder=cache_key_builder,
+    skip_cache_func=lambda record: record is None or not record["confirmed"],
+)
+async def _get_user_record(username: str, db: AsyncSession) -> Optional[dict]:
     """
-    Retrieve a user from the database using cache.
+    Fetch the cacheable field dict for a user.
+
+    A plain dict (not the ORM instance) goes through the cache so the Redis
+    serializer can stay JSON instead of pickling a mapped object. Only
+    confirmed users are cached: unconfirmed accounts change state right
+    after registration, and misses for unknown usernames must stay fresh.
 
     Parameters:
     - username: str – the username to look up.
     - db: AsyncSession – the database session.
 
     Returns:
-    - User: The user object.
+    - Optional[dict]: The user's fields, or None if not found.
     """
-    print("NOT CACHED USER")
+    logger.debug("User cache miss for %s", username)
     user_service = UserService(db)
     user = await user_service.get_user_by_username(username)
+    if user is None:
+        return None
+    return {
+        "id": user.id,
+        "username": user.username,
+        "email": user.email,
+        "hashed_password": user.hashed_password,
+        "avatar": user.avatar,
+        "confirmed": user.confirmed,
+        "role": user.role.value,
+    }
+
+
+# L1 in front of the Redis-backed record cache: a hit costs a dict lookup
+# instead of a Redis round trip plus deserialization. Same admission rule as
+# L2 — only confirmed users — and invalidate_user_cache drops both levels.
+_USER_L1: dict = {}
+_USER_L1_MAX = 1024
+_USER_L1_TTL = 30.0
+
 
+async def get_user_from_db(username: str, db: AsyncSession) -> User:
+    """
+    Retrieve a user from the database using the two-level cache.
+
+    Parameters:
+    - username: str – the username to look up.
+    - db: AsyncSession – the database session.
+
+    Returns:
+    - User: The user object, rehydrated from the cached field dict.
+    """
+    now = time.monotonic()
+    entry = _USER_L1.get(username)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+
+    record = await _get_user_record(username, db)
+    if record is None:
+        return None
+    user = User(**{**record, "role": UserRole(record["role"])})
+    if user.confirmed:
+        if len(_USER_L1) >= _USER_L1_MAX:
+            _USER_L1.clear()
+        _USER_L1[username] = (now + _USER_L1_TTL, user)
     return user
 
 
+async def invalidate_user_cache(username: str) -> None:
+    """
+    Drop the cached entry for a user after a state-changing operation.
+
+    Call this whenever confirmation status, password or avatar change, so
+    `login_user` and `get_current_user` do not serve a stale row for the TTL.
+
+    Parameters:
+    - username: str – the username whose cache entry should be removed.
+    """
+    _USER_L1.pop(username, None)
+    for key, (_, user) in list(_TOKEN_CACHE.items()):
+        if user.username == username:
+            _TOKEN_CACHE.pop(key, None)
+    try:
+        await _get_user_record.cache.delete(
+            cache_key_builder(_get_user_record, (username,), {})
+        )
+    except Exception:
+        # The cache backend being unreachable must never fail the request;
+        # the entry will expire with its TTL instead.
+        pass
+
+
+# In-process L1 cache for get_current_user, keyed by a fixed-size digest of
+# the raw bearer token. For the lifetime of an entry the HMAC verification,
+# the Redis round trip and the DB lookup are all skipped. Only tokens with a
+# valid future exp claim are admitted, and entries never outlive the token.
+_TOKEN_CACHE: dict = {}
+_TOKEN_CACHE_MAX = 10_000
+_TOKEN_CACHE_TTL = 60.0
+
+
+def _token_cache_key(token: str) -> bytes:
+    """
+    Derive a fixed-size cache key from the raw bearer token.
+
+    Parameters:
+    - token: str – the raw JWT string.
+
+    Returns:
+    - bytes: A 16-byte BLAKE2s digest, bounding per-entry key memory.
+    """
+    return hashlib.blake2s(token.encode(), digest_size=16).digest()
+
+
 async def get_current_user(
+    request: Request = None,
     token: str = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_db)
 ):
     """
-    Extract the current user from the JWT token and fetch from the database.
+    Extract the current user from the JWT token and fetch from the cache or database.
+
+    A short-lived in-process cache keyed by the token itself short-circuits
+    the decode and lookup entirely for repeat requests; on a miss, the
+    database lookup still goes through the cached `get_user_from_db`, so the
+    Redis layer keeps working across workers.
 
     Parameters:
     - token: str – JWT token from request header.
@@ -142,22 +390,42 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+    cache_key = _token_cache_key(token)
+    now = time.monotonic()
+    entry = _TOKEN_CACHE.get(cache_key)
+    if entry is not None and entry[0] > now:
+        user = entry[1]
+        if request is not None:
+            request.state.user = user
+        return user
+
     try:
-        print("[DEBUG] ORIGINAL get_current_user CALLED1")
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = jwt.decode(token, **_DECODE_KWARGS)
         username: str = payload.get("sub")
         if username is None:
             raise credentials_exception
     except JWTError:
         raise credentials_exception
 
-    user_service = UserService(db)
-    user = await user_service.get_user_by_username(username)
+    user = await get_user_from_db(username, db)
     if user is None:
         raise credentials_exception
 
+    exp = payload.get("exp")
+    if exp is not None:
+        # Cap the entry at the token's own remaining lifetime so an expired
+        # token can never be served from the cache.
+        ttl = min(_TOKEN_CACHE_TTL, exp - time.time())
+        if ttl > 0:
+            if len(_TOKEN_CACHE) >= _TOKEN_CACHE_MAX:
+                _TOKEN_CACHE.clear()
+            _TOKEN_CACHE[cache_key] = (now + ttl, user)
+
+    if request is not None:
+        # Stash the resolved user so downstream key funcs (rate limiter)
+        # can bucket by identity without re-running authentication.
+        request.state.user = user
+
     return user
 
 
@@ -207,9 +475,7 @@ async def get_email_from_token(token: str) -> str:
     - HTTPException: If token is invalid or email is missing.
     """
     try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = jwt.decode(token, **_DECODE_KWARGS)
         email: str = payload.get("sub")
         if not email:
             raise ValueError("Missing subject in token")
@@ -235,9 +501,7 @@ async def get_password_from_token(token: str) -> str:
     - HTTPException: If token is invalid or malformed.
     """
     try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = jwt.decode(token, **_DECODE_KWARGS)
         password = payload["password"]
         return password
     except JWTError as e:
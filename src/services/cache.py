@@ -1,16 +1,19 @@
 from aiocache import caches
 
+from src.conf.config import settings
+
 # Setting up a caching configuration to use Redis
 caches.set_config(
     {
         "default": {
             "cache": "aiocache.RedisCache",  # Тип кешу - Redis
-            "endpoint": "localhost",  # Адреса Redis сервера
-            "port": 6379,  # Порт Redis сервера
+            "endpoint": settings.REDIS_HOST,  # Адреса Redis сервера
+            "port": settings.REDIS_PORT,  # Порт Redis сервера
             "timeout": 10,  # Час очікування на відповідь
+            "pool_max_size": 20,  # Розмір пулу з'єднань Redis
             "serializer": {
-                "class": "aiocache.serializers.PickleSerializer"
-            },  # Сералізатор для кешування даних
+                "class": "aiocache.serializers.JsonSerializer"
+            },  # JSON: менші пейлоади та швидше за Pickle
         }
     }
-)
\ No newline at end of file
+)
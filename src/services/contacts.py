@@ -32,12 +32,26 @@ class ContactService:
         Raises:
         - HTTPException: If a contact with the same email or phone already exists.
         """
-        if await self.repository.is_contact_exists(body.email, body.phone, user):
+        contact = await self.repository.create_contact(body, user)
+        if contact is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Contact with '{body.email}' email or '{body.phone}' phone number already exists.",
             )
-        return await self.repository.create_contact(body, user)
+        return contact
+
+    async def bulk_create_contacts(self, bodies: List[ContactModel], user: User):
+        """
+        Create many contacts for the user in one batched operation.
+
+        Parameters:
+        - bodies: List[ContactModel] – the contacts to create.
+        - user: User – the current authorized user.
+
+        Returns:
+        - List[int]: IDs of the created contacts.
+        """
+        return await self.repository.bulk_create_contacts(bodies, user)
 
     async def get_contacts(
         self, name: str, surname: str, email: str, skip: int, limit: int, user: User
@@ -71,6 +85,19 @@ class ContactService:
         """
         return await self.repository.get_contact_by_id(contact_id, user)
 
+    async def get_contacts_by_ids(self, ids: List[int], user: User):
+        """
+        Retrieve several contacts by their IDs in a single query.
+
+        Parameters:
+        - ids: List[int] – the IDs of the contacts to retrieve.
+        - user: User – the current authorized user.
+
+        Returns:
+        - List[Contact]: The contacts found for the given IDs.
+        """
+        return await self.repository.get_contacts_by_ids(ids, user)
+
     async def update_contact(self, contact_id: int, body: ContactModel, user: User):
         """
         Update an existing contact with new data.
@@ -1,6 +1,8 @@
+import asyncio
+import time
 from pathlib import Path
 from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
-from fastapi_mail.errors import ConnectionErrors
+from jinja2 import Environment, FileSystemLoader
 from pydantic import EmailStr
 
 from src.services.auth import create_email_token
@@ -20,6 +22,41 @@ conf = ConnectionConfig(
     TEMPLATE_FOLDER=Path(__file__).parent / "templates",
 )
 
+# Shared FastMail instance: constructing one per send re-read the config and
+# re-created the template environment each time. The SMTP session itself is
+# still opened per message (fastapi-mail's send_message manages the
+# connection), but all per-instance setup is now paid once at import.
+fm = FastMail(conf)
+
+# The templates are static, so they are parsed and compiled once here.
+# Going through send_message(template_name=...) would rebuild a Jinja
+# Environment and re-parse the template file on every send.
+_TEMPLATES = Environment(
+    loader=FileSystemLoader(Path(__file__).parent / "templates"),
+    autoescape=True,
+)
+_VERIFY_TPL = _TEMPLATES.get_template("verify_email.html")
+_RESET_TPL = _TEMPLATES.get_template("reset_password.html")
+
+# Short-TTL memo for verification tokens: a user double-clicking "resend"
+# reuses the token signed seconds ago instead of re-running the HMAC (and
+# both emails carry the same, still-valid link). Entries hold
+# (expires_at, token); the dict is dropped wholesale at the cap, mirroring
+# the token cache in src.services.auth.
+_VERIFY_TOKEN_TTL = 300
+_VERIFY_TOKEN_CACHE_MAX = 10_000
+_VERIFY_TOKEN_CACHE: dict[str, tuple[float, str]] = {}
+
+
+def invalidate_verify_token(email: str) -> None:
+    """
+    Drop the memoized verification token after the email is confirmed.
+
+    Arguments:
+        email: The address whose cached token should be discarded.
+    """
+    _VERIFY_TOKEN_CACHE.pop(email, None)
+
 
 async def send_confirm_email(to_email: EmailStr, username: str, host: str) -> None:
     """
@@ -35,27 +72,39 @@ async def send_confirm_email(to_email: EmailStr, username: str, host: str) -> No
 
     Throws:
         ConnectionErrors: If an error occurs while connecting to the email server.
+        Errors propagate to the caller (the queue worker retries transient
+        ones); they are not swallowed here.
     """
-    try:
-        # Створення токену для підтвердження електронної пошти
-        token_verification = create_email_token({"sub": to_email})
-        # Формування повідомлення для відправки
-        message = MessageSchema(
-            subject="Confirm your email",
-            recipients=[to_email],
-            template_body={
-                "host": host,
-                "username": username,
-                "token": token_verification,
-            },
-            subtype=MessageType.html,
+    # Створення токену для підтвердження електронної пошти.
+    # Підпис JWT — це CPU-bound HMAC, тому виконується у воркер-потоці,
+    # щоб не блокувати event loop; швидкі повторні запити беруть токен
+    # із memo-кешу.
+    now = time.time()
+    cached = _VERIFY_TOKEN_CACHE.get(to_email)
+    if cached is not None and cached[0] > now:
+        token_verification = cached[1]
+    else:
+        token_verification = await asyncio.to_thread(
+            create_email_token, {"sub": to_email}
         )
+        if len(_VERIFY_TOKEN_CACHE) >= _VERIFY_TOKEN_CACHE_MAX:
+            _VERIFY_TOKEN_CACHE.clear()
+        _VERIFY_TOKEN_CACHE[to_email] = (
+            now + _VERIFY_TOKEN_TTL,
+            token_verification,
+        )
+    # Формування повідомлення для відправки
+    message = MessageSchema(
+        subject="Confirm your email",
+        recipients=[to_email],
+        body=_VERIFY_TPL.render(
+            host=host, username=username, token=token_verification
+        ),
+        subtype=MessageType.html,
+    )
 
-        # Ініціалізація FastMail та відправка повідомлення
-        fm = FastMail(conf)
-        await fm.send_message(message, template_name="verify_email.html")
-    except ConnectionErrors as err:
-        print(err)
+    # Відправка повідомлення через спільний FastMail
+    await fm.send_message(message)
 
 
 async def send_reset_password_email(
@@ -75,21 +124,19 @@ async def send_reset_password_email(
 
     Throws:
         ConnectionErrors: If an error occurs while connecting to the email server.
+        Errors propagate to the caller (the queue worker retries transient
+        ones); they are not swallowed here.
     """
-    try:
-        # Формування посилання для скидання пароля
-        reset_link = f"{host}api/auth/confirm_reset_password/{reset_token}"
-
-        # Формування повідомлення для відправки
-        message = MessageSchema(
-            subject="Important: Update your account information",
-            recipients=[to_email],
-            template_body={"reset_link": reset_link, "username": username},
-            subtype=MessageType.html,
-        )
+    # Формування посилання для скидання пароля
+    reset_link = f"{host}api/auth/confirm_reset_password/{reset_token}"
+
+    # Формування повідомлення для відправки
+    message = MessageSchema(
+        subject="Important: Update your account information",
+        recipients=[to_email],
+        body=_RESET_TPL.render(reset_link=reset_link, username=username),
+        subtype=MessageType.html,
+    )
 
-        # Ініціалізація FastMail та відправка повідомлення
-        fm = FastMail(conf)
-        await fm.send_message(message, template_name="reset_password.html")
-    except ConnectionErrors as err:
-        print(err)
\ No newline at end of file
+    # Відправка повідомлення через спільний FastMail
+    await fm.send_message(message)
\ No newline at end of file
@@ -0,0 +1,143 @@
+"""
+In-process asyncio queue for delivering emails off the request path.
+
+Sits between Celery and FastAPI `BackgroundTasks` in the dispatch order of
+`src.api.auth.enqueue_email`: when no broker is configured but the app
+lifespan has started the workers, handlers drop a message onto the queue
+and return immediately, while the worker tasks run the SMTP I/O
+concurrently with request handling. `BackgroundTasks` remains the fallback
+for contexts where the lifespan never ran (tests, scripts).
+
+The senders themselves propagate failures, so this worker is the one place
+where SMTP errors are handled: transient rejections (421/450/451/452) and
+connection failures are retried with exponential backoff, everything else
+is logged.
+"""
+
+import asyncio
+import logging
+
+from aiosmtplib.errors import SMTPResponseException
+from fastapi_mail.errors import ConnectionErrors
+
+from src.services.email import send_confirm_email, send_reset_password_email
+
+logger = logging.getLogger(__name__)
+
+_SENDERS = {
+    "send_confirm_email": send_confirm_email,
+    "send_reset_password_email": send_reset_password_email,
+}
+
+# SMTP reply codes that signal a temporary condition worth retrying.
+_RETRYABLE_CODES = {421, 450, 451, 452}
+_MAX_ATTEMPTS = 3
+
+_queue: asyncio.Queue | None = None
+_workers: list[asyncio.Task] = []
+
+
+def is_running() -> bool:
+    """
+    Check whether the worker tasks were started by the app lifespan.
+
+    Returns:
+    - bool: True if messages can be enqueued.
+    """
+    return _queue is not None and bool(_workers)
+
+
+def has_sender(kind: str) -> bool:
+    """
+    Check whether a sender with this name can be dispatched to the queue.
+
+    Parameters:
+    - kind (str): Sender name to look up.
+
+    Returns:
+    - bool: True if `enqueue_email` accepts this kind.
+    """
+    return kind in _SENDERS
+
+
+def enqueue_email(kind: str, *args, **kwargs) -> None:
+    """
+    Put an email job onto the queue without blocking the caller.
+
+    The queue is unbounded, so the put never waits; the handler pays only
+    the cost of appending a tuple.
+
+    Parameters:
+    - kind (str): Sender name, one of the keys of `_SENDERS`.
+    - args / kwargs: Arguments forwarded to the sender coroutine.
+    """
+    if kind not in _SENDERS:
+        raise ValueError(f"Unknown email kind: {kind!r}")
+    _queue.put_nowait((kind, args, kwargs))
+
+
+async def _send_with_retry(kind: str, args: tuple, kwargs: dict) -> None:
+    """
+    Run one sender, retrying transient SMTP rejections with backoff.
+    """
+    for attempt in range(1, _MAX_ATTEMPTS + 1):
+        try:
+            await _SENDERS[kind](*args, **kwargs)
+            return
+        except SMTPResponseException as err:
+            if err.code not in _RETRYABLE_CODES or attempt == _MAX_ATTEMPTS:
+                logger.error("Email %s failed: %s", kind, err)
+                return
+            # 2s, 4s, ... — темпоральні відмови SMTP зазвичай короткі
+            await asyncio.sleep(2**attempt)
+        except ConnectionErrors as err:
+            # Connection-phase failures (DNS, refused, handshake) are
+            # usually transient too.
+            if attempt == _MAX_ATTEMPTS:
+                logger.error("Email %s failed: %s", kind, err)
+                return
+            await asyncio.sleep(2**attempt)
+        except Exception:
+            logger.exception("Email %s failed", kind)
+            return
+
+
+async def _worker() -> None:
+    """
+    Worker loop: pull jobs off the queue until cancelled.
+    """
+    while True:
+        kind, args, kwargs = await _queue.get()
+        try:
+            await _send_with_retry(kind, args, kwargs)
+        finally:
+            _queue.task_done()
+
+
+def start(num_workers: int = 2) -> None:
+    """
+    Spawn the worker tasks; called from the app lifespan on startup.
+
+    Parameters:
+    - num_workers (int): Number of concurrent SMTP workers.
+    """
+    global _queue
+    _queue = asyncio.Queue()
+    for i in range(num_workers):
+        _workers.append(asyncio.create_task(_worker(), name=f"email-worker-{i}"))
+
+
+async def shutdown() -> None:
+    """
+    Drain the queue, then cancel the workers; called on app shutdown so
+    already-accepted emails are still delivered.
+    """
+    global _queue
+    if _queue is None:
+        return
+    await _queue.join()
+    for worker in _workers:
+        worker.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+    _workers.clear()
+    _queue = None
@@ -0,0 +1,61 @@
+"""
+Celery tasks for delivering emails off the HTTP worker.
+
+When `CELERY_BROKER_URL` is configured (and Celery is installed), the API
+handlers enqueue email delivery on the worker instead of running SMTP inside
+the serving process. Without a broker the handlers fall back to FastAPI
+`BackgroundTasks`, so local development and tests need no extra
+infrastructure.
+
+Run the worker with:
+```
+celery -A src.services.tasks worker
+```
+"""
+
+import asyncio
+
+from src.conf.config import settings
+from src.services.email import send_confirm_email, send_reset_password_email
+
+try:
+    from celery import Celery
+except ImportError:  # Celery is an optional runtime dependency.
+    Celery = None
+
+celery_app = (
+    Celery("contacts", broker=settings.CELERY_BROKER_URL)
+    if Celery is not None and settings.CELERY_BROKER_URL
+    else None
+)
+
+
+def celery_enabled() -> bool:
+    """
+    Check whether the Celery broker is configured and usable.
+
+    Returns:
+    - bool: True if tasks can be enqueued on the worker.
+    """
+    return celery_app is not None
+
+
+if celery_app is not None:
+
+    @celery_app.task(name="emails.send_confirm_email")
+    def send_confirm_email_task(to_email: str, username: str, host: str) -> None:
+        """
+        Worker-side wrapper around `send_confirm_email`.
+        """
+        asyncio.run(send_confirm_email(to_email, username, host))
+
+    @celery_app.task(name="emails.send_reset_password_email")
+    def send_reset_password_email_task(
+        to_email: str, username: str, host: str, reset_token: str
+    ) -> None:
+        """
+        Worker-side wrapper around `send_reset_password_email`.
+        """
+        asyncio.run(
+            send_reset_password_email(to_email, username, host, reset_token)
+        )
@@ -1,34 +1,60 @@
+import asyncio
+
 import cloudinary
 import cloudinary.uploader
 
+from src.conf.config import settings
+
+# Size of the parts sent to Cloudinary; keeps memory bounded to one chunk
+# regardless of how large the uploaded file is. The SDK uploads parts
+# sequentially, so for big files the lever is fewer, larger parts — past
+# the threshold we trade a little memory for fewer HTTP round trips.
+UPLOAD_CHUNK_SIZE = 6 * 1024 * 1024
+UPLOAD_CHUNK_SIZE_LARGE = 20 * 1024 * 1024
+LARGE_FILE_THRESHOLD = 100 * 1024 * 1024
+
+
+def _chunk_size_for(file_size: int | None) -> int:
+    """
+    Pick the upload part size from the declared file size.
+
+    Arguments:
+        file_size: Size of the upload in bytes, or None when unknown.
+
+    Returns:
+        int: The part size to pass to upload_large.
+    """
+    if file_size and file_size >= LARGE_FILE_THRESHOLD:
+        return UPLOAD_CHUNK_SIZE_LARGE
+    return UPLOAD_CHUNK_SIZE
+
+
+# Cloudinary keeps its configuration in process-global state, so it is set
+# once at import instead of being rewritten on every request.
+cloudinary.config(
+    cloud_name=settings.CLOUDINARY_NAME,
+    api_key=settings.CLOUDINARY_API_KEY,
+    api_secret=settings.CLOUDINARY_API_SECRET,
+    secure=True,
+)
+
 
 class UploadFileService:
-    def __init__(self, cloud_name, api_key, api_secret):
-        """
-        Initializing the service for uploading files to Cloudinary.
+    """
+    Namespace for uploading files to Cloudinary.
 
-        Arguments:
-            cloud_name: The name of the cloud in Cloudinary.
-            api_key: API key to access Cloudinary.
-            api_secret: API secret to access Cloudinary.
-        """
-        self.cloud_name = cloud_name
-        self.api_key = api_key
-        self.api_secret = api_secret
-        cloudinary.config(
-            cloud_name=self.cloud_name,
-            api_key=self.api_key,
-            api_secret=self.api_secret,
-            secure=True,
-        )
+    Credentials come from `settings` via the module-level
+    `cloudinary.config(...)` call above.
+    """
 
     @staticmethod
-    def upload_file(file, username) -> str:
+    async def upload_file(file, username) -> str:
         """
         Uploads a file to Cloudinary and generates a URL to access the image.
 
-        Generates a unique identifier for the user and uploads the file to the server.
-        After successful upload, returns the URL of the image with certain parameters (size, cropping).
+        The file stream is sent in UPLOAD_CHUNK_SIZE parts via Cloudinary's
+        chunked upload, and the blocking HTTP calls run in a worker thread so
+        the event loop stays free for other requests.
 
         Arguments:
             file: The file to upload.
@@ -38,7 +64,13 @@ class UploadFileService:
             str: URL of the image available on Cloudinary.
         """
         public_id = f"RestApp/{username}"
-        r = cloudinary.uploader.upload(file.file, public_id=public_id, overwrite=True)
+        r = await asyncio.to_thread(
+            cloudinary.uploader.upload_large,
+            file.file,
+            public_id=public_id,
+            overwrite=True,
+            chunk_size=_chunk_size_for(getattr(file, "size", None)),
+        )
         src_url = cloudinary.CloudinaryImage(public_id).build_url(
             width=250, height=250, crop="fill", version=r.get("version")
         )
@@ -1,9 +1,31 @@
+import hashlib
+from functools import lru_cache
+
 from sqlalchemy.ext.asyncio import AsyncSession
-from libgravatar import Gravatar
 from src.repository.users import UserRepository
 from src.schemas import UserCreate
 
 
+@lru_cache(maxsize=1024)
+def gravatar_url(email: str, size: int = 80) -> str:
+    """
+    Build the Gravatar URL for an email address locally.
+
+    The URL is just a hash of the normalized address — no lookup against
+    the Gravatar service is needed, and repeated registrations with the
+    same address reuse the memoized result.
+
+    Parameters:
+    - email: str – the email address to build the avatar URL for.
+    - size: int – requested image size in pixels.
+
+    Returns:
+    - str: The avatar URL.
+    """
+    digest = hashlib.sha256(email.strip().lower().encode()).hexdigest()
+    return f"https://gravatar.com/avatar/{digest}?s={size}&d=identicon"
+
+
 class UserService:
     def __init__(self, db: AsyncSession):
         """
@@ -16,7 +38,7 @@ class UserService:
 
     async def create_user(self, body: UserCreate):
         """
-        Create a new user and generate a Gravatar avatar if possible.
+        Create a new user with a locally computed Gravatar avatar URL.
 
         Parameters:
         - body: UserCreate – user registration data.
@@ -24,13 +46,7 @@ class UserService:
         Returns:
         - User: The newly created user.
         """
-        avatar = None
-        try:
-            g = Gravatar(body.email)
-            avatar = g.get_image()
-        except Exception as e:
-            print(e)
-
+        avatar = gravatar_url(body.email)
         return await self.repository.create_user(body, avatar)
 
     async def get_user_by_id(self, user_id: int):
@@ -69,6 +85,19 @@ class UserService:
         """
         return await self.repository.get_user_by_email(email)
 
+    async def get_user_by_email_or_username(self, email: str, username: str):
+        """
+        Retrieve a user by email or username with a single round trip.
+
+        Parameters:
+        - email: str – the email of the user.
+        - username: str – the username of the user.
+
+        Returns:
+        - User | None: The first matching user, otherwise None.
+        """
+        return await self.repository.get_user_by_email_or_username(email, username)
+
     async def confirmed_email(self, email: str):
         """
         Mark a user's email as confirmed.
@@ -92,4 +121,17 @@ class UserService:
         Returns:
         - User: The updated user.
         """
-        return await self.repository.update_avatar_url(email, url)
\ No newline at end of file
+        return await self.repository.update_avatar_url(email, url)
+
+    async def reset_password(self, user_id: int, password: str):
+        """
+        Replace the user's password hash.
+
+        Parameters:
+        - user_id: int – the ID of the user to update.
+        - password: str – the new hashed password.
+
+        Returns:
+        - User: The updated user.
+        """
+        return await self.repository.reset_password(user_id, password)
\ No newline at end of file
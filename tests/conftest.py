@@ -24,6 +24,27 @@ TestingSessionLocal = async_sessionmaker(
     autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
 )
 
+_UNSET = object()
+
+
+def make_exec_result(*, scalars_all=_UNSET, scalar_one=_UNSET, scalar=_UNSET):
+    """
+    Build the result mock for `session.execute` in one call.
+
+    Replaces the hand-wired `mock_result.scalars.return_value.all...` chains
+    repeated across the unit tests; pass only the accessor the code under
+    test uses (None is a valid return value, hence the sentinel default).
+    """
+    result = MagicMock()
+    if scalars_all is not _UNSET:
+        result.scalars.return_value.all.return_value = scalars_all
+    if scalar_one is not _UNSET:
+        result.scalar_one_or_none.return_value = scalar_one
+    if scalar is not _UNSET:
+        result.scalar.return_value = scalar
+    return result
+
+
 test_user = {
     "username": "mom",
     "email": "mom@gmail.com",
@@ -94,7 +115,7 @@ def init_models_wrap():
             await conn.run_sync(Base.metadata.drop_all)
             await conn.run_sync(Base.metadata.create_all)
         async with TestingSessionLocal() as session:
-            hash_password = Hash().get_password_hash(test_user["password"])
+            hash_password = await Hash().get_password_hash(test_user["password"])
             current_user = User(
                 username=test_user["username"],
                 email=test_user["email"],
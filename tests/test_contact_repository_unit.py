@@ -1,14 +1,17 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from sqlalchemy.ext.asyncio import AsyncSession
+from unittest.mock import AsyncMock
 from src.database.models import Contact, User
 from src.repository.contacts import ContactRepository
 from src.schemas import ContactModel
+from tests.conftest import make_exec_result
 
 
 @pytest.fixture(scope="function")
 def mock_session():
-    return AsyncMock(spec=AsyncSession)
+    # Bare mock: spec=AsyncSession would getattr-check every AsyncSession
+    # attribute at construction for no gain — the tests assert the exact
+    # execute/commit calls themselves.
+    return AsyncMock()
 
 
 @pytest.fixture(scope="function")
@@ -16,7 +19,11 @@ def contact_repository(mock_session):
     return ContactRepository(mock_session)
 
 
-@pytest.fixture(scope="function")
+# user and contact_body are read-only in every test, so they are built once
+# per module instead of re-running ORM setup and Pydantic validation (date
+# parsing included) for each test. contact stays function-scoped: it is
+# mutated in test_update_contact.
+@pytest.fixture(scope="module")
 def user():
     return User(id=1, username="testuser", role="user")
 
@@ -34,7 +41,7 @@ def contact(user: User):
     )
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="module")
 def contact_body():
     return ContactModel(
         name="Evan",
@@ -49,9 +56,9 @@ class TestContactRepository:
     @pytest.mark.asyncio
     async def test_get_contacts(self, contact_repository, mock_session, user, contact):
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = [contact]
-        mock_session.execute = AsyncMock(return_value=mock_result)
+        mock_session.execute = AsyncMock(
+            return_value=make_exec_result(scalars_all=[contact])
+        )
 
         # Act
         contacts = await contact_repository.get_contacts(
@@ -62,13 +69,18 @@ class TestContactRepository:
         assert len(contacts) == 1
         assert contacts[0].name == "Evan"
         mock_session.execute.assert_called_once()
+        # raiseload(Contact.user) must stay on the listing statement: without
+        # it an accidental contact.user access degrades to one lazy SELECT
+        # per row instead of failing loudly.
+        executed_stmt = mock_session.execute.call_args.args[0]
+        assert executed_stmt._with_options
 
     @pytest.mark.asyncio
     async def test_get_contact_by_id(self, contact_repository, mock_session, user, contact):
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = contact
-        mock_session.execute = AsyncMock(return_value=mock_result)
+        mock_session.execute = AsyncMock(
+            return_value=make_exec_result(scalar_one=contact)
+        )
 
         # Act
         contact_record = await contact_repository.get_contact_by_id(contact_id=1, user=user)
@@ -80,85 +92,116 @@ class TestContactRepository:
         mock_session.execute.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_create_contact_successful(self, contact_repository, mock_session, user, contact_body):
+    async def test_get_contacts_by_ids(self, contact_repository, mock_session, user, contact):
+        # Arrange
+        mock_session.execute = AsyncMock(
+            return_value=make_exec_result(scalars_all=[contact])
+        )
+
         # Act
-        result = await contact_repository.create_contact(body=contact_body, user=user)
+        contacts = await contact_repository.get_contacts_by_ids(ids=[1, 2], user=user)
 
         # Assert
-        assert isinstance(result, Contact)
-        assert result.name == "Evan"
-        mock_session.add.assert_called_once()
-        mock_session.commit.assert_awaited_once()
-        mock_session.refresh.assert_awaited_once_with(result)
+        assert len(contacts) == 1
+        assert contacts[0].id == 1
+        mock_session.execute.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_create_contact_failure(self, contact_repository, mock_session, user, contact_body):
+    async def test_get_contacts_by_ids_empty(self, contact_repository, mock_session, user):
+        # Act
+        contacts = await contact_repository.get_contacts_by_ids(ids=[], user=user)
+
+        # Assert
+        assert contacts == []
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("created", [True, False], ids=["created", "conflict"])
+    async def test_create_contact(self, contact_repository, mock_session, user, contact, contact_body, created):
+        # Arrange: ON CONFLICT DO NOTHING returns no row for a duplicate
+        returned = contact if created else None
+        mock_session.execute = AsyncMock(
+            return_value=make_exec_result(scalar_one=returned)
+        )
+
         # Act
         result = await contact_repository.create_contact(body=contact_body, user=user)
 
         # Assert
-        assert isinstance(result, Contact)
-        assert result.name != "Evan2"
-        mock_session.add.assert_called_once()
-        mock_session.commit.assert_awaited_once()
-        mock_session.refresh.assert_awaited_once_with(result)
+        assert result is returned
+        mock_session.execute.assert_called_once()
+        if created:
+            mock_session.commit.assert_awaited_once()
+        else:
+            mock_session.commit.assert_not_awaited()
 
     @pytest.mark.asyncio
-    async def test_update_contact(self, contact_repository, mock_session, user, contact):
+    async def test_bulk_create_contacts(self, contact_repository, mock_session, user, contact_body):
         # Arrange
-        contact_data = ContactModel(**{k: v for k, v in contact.__dict__.items() if not k.startswith('_')})
-        contact_data.name = "Evan2"
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = contact
-        mock_session.execute = AsyncMock(return_value=mock_result)
+        mock_session.execute = AsyncMock(
+            return_value=make_exec_result(scalars_all=[1])
+        )
 
         # Act
-        result = await contact_repository.update_contact(contact_id=1, body=contact_data, user=user)
+        ids = await contact_repository.bulk_create_contacts(bodies=[contact_body], user=user)
 
         # Assert
-        assert result is not None
-        assert result.name == "Evan2"
+        assert ids == [1]
+        mock_session.execute.assert_called_once()
         mock_session.commit.assert_awaited_once()
-        mock_session.refresh.assert_awaited_once_with(contact)
 
     @pytest.mark.asyncio
-    async def test_remove_contact(self, contact_repository, mock_session, user, contact):
+    async def test_bulk_create_contacts_empty(self, contact_repository, mock_session, user):
+        # Act
+        ids = await contact_repository.bulk_create_contacts(bodies=[], user=user)
+
+        # Assert
+        assert ids == []
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_contact(self, contact_repository, mock_session, user, contact):
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = contact
-        mock_session.execute = AsyncMock(return_value=mock_result)
+        contact_data = ContactModel.model_validate(
+            contact, from_attributes=True
+        ).model_copy(update={"name": "Evan2"})
+        contact.name = "Evan2"  # RETURNING hands back the row with values applied
+        mock_session.execute = AsyncMock(
+            return_value=make_exec_result(scalar_one=contact)
+        )
 
         # Act
-        result = await contact_repository.remove_contact(contact_id=1, user=user)
+        result = await contact_repository.update_contact(contact_id=1, body=contact_data, user=user)
 
         # Assert
-        assert result is not None
-        assert result.name == "Evan"
-        mock_session.delete.assert_called_once_with(contact)
+        assert result is contact
+        assert result.name == "Evan2"
+        mock_session.execute.assert_called_once()
         mock_session.commit.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_is_contact_exists_success(self, contact_repository, mock_session, user, contact):
+    async def test_remove_contact(self, contact_repository, mock_session, user, contact):
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.first.return_value = contact
-        mock_session.execute = AsyncMock(return_value=mock_result)
+        mock_session.execute = AsyncMock(
+            return_value=make_exec_result(scalar_one=contact)
+        )
 
         # Act
-        is_contact_exist = await contact_repository.is_contact_exists(
-            "qwerty@gmail.com", "111-22-33", user=user
-        )
+        result = await contact_repository.remove_contact(contact_id=1, user=user)
 
         # Assert
-        assert is_contact_exist is True
+        assert result is contact
+        assert result.name == "Evan"
         mock_session.execute.assert_called_once()
+        mock_session.commit.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_is_contact_exists_failure(self, contact_repository, mock_session, user):
-        # Arrange
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.first.return_value = None
-        mock_session.execute = AsyncMock(return_value=mock_result)
+    @pytest.mark.parametrize("found", [True, False])
+    async def test_is_contact_exists(self, contact_repository, mock_session, user, found):
+        # Arrange: SELECT EXISTS(...) yields a single boolean
+        mock_session.execute = AsyncMock(
+            return_value=make_exec_result(scalar=found)
+        )
 
         # Act
         is_contact_exist = await contact_repository.is_contact_exists(
@@ -166,5 +209,5 @@ class TestContactRepository:
         )
 
         # Assert
-        assert is_contact_exist is False
+        assert is_contact_exist is found
         mock_session.execute.assert_called_once()
\ No newline at end of file
@@ -1,14 +1,18 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock
-from sqlalchemy.ext.asyncio import AsyncSession
 from src.database.models import User
 from src.repository.users import UserRepository
 from src.schemas import UserCreate
+from tests.conftest import make_exec_result
 
 
 @pytest.fixture
 def mock_session():
-    mock_session = AsyncMock(spec=AsyncSession)
+    # Bare mock: spec=AsyncSession would getattr-check every AsyncSession
+    # attribute at construction for no gain. add() is synchronous on a real
+    # session, so it gets a plain MagicMock to avoid an unawaited coroutine.
+    mock_session = AsyncMock()
+    mock_session.add = MagicMock()
     return mock_session
 
 
@@ -40,9 +44,9 @@ def user_body():
 
 @pytest.mark.asyncio
 async def test_get_user_by_id(user_repository, mock_session, user):
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = user
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute = AsyncMock(
+        return_value=make_exec_result(scalar_one=user)
+    )
 
     result = await user_repository.get_user_by_id(1)
 
@@ -53,9 +57,9 @@ async def test_get_user_by_id(user_repository, mock_session, user):
 
 @pytest.mark.asyncio
 async def test_get_user_by_username(user_repository, mock_session, user):
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = user
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute = AsyncMock(
+        return_value=make_exec_result(scalar_one=user)
+    )
 
     result = await user_repository.get_user_by_username("testuser")
 
@@ -66,9 +70,9 @@ async def test_get_user_by_username(user_repository, mock_session, user):
 
 @pytest.mark.asyncio
 async def test_get_user_by_email(user_repository, mock_session, user):
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = user
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute = AsyncMock(
+        return_value=make_exec_result(scalar_one=user)
+    )
 
     result = await user_repository.get_user_by_email("test@example.com")
 
@@ -79,9 +83,6 @@ async def test_get_user_by_email(user_repository, mock_session, user):
 
 @pytest.mark.asyncio
 async def test_create_user(user_repository, mock_session, user, user_body):
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = user
-
     result = await user_repository.create_user(
         user_body,
         avatar="https://example.com/avatar.jpg",
@@ -94,54 +95,51 @@ async def test_create_user(user_repository, mock_session, user, user_body):
 
     mock_session.add.assert_called_once()
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(result)
+    mock_session.refresh.assert_not_awaited()
 
 
 @pytest.mark.asyncio
 async def test_confirmed_email(user_repository, mock_session, user):
-    mock_session.execute = AsyncMock(
-        return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=user))
-    )
-    user.confirmed = False
+    mock_session.execute = AsyncMock()
 
     await user_repository.confirmed_email(user.email)
 
-    assert user.confirmed is True
+    mock_session.execute.assert_called_once()
     mock_session.commit.assert_awaited_once()
 
 
 @pytest.mark.asyncio
 async def test_update_avatar_url(user_repository, mock_session, user):
     mock_session.execute = AsyncMock(
-        return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=user))
+        return_value=make_exec_result(scalar_one=user)
     )
     new_avatar_url = "https://example.com/new_avatar.jpg"
 
     result = await user_repository.update_avatar_url(user.email, new_avatar_url)
 
-    assert result.avatar == new_avatar_url
+    assert result is user
+    mock_session.execute.assert_called_once()
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(result)
 
 
 @pytest.mark.asyncio
 async def test_reset_password(user_repository, mock_session, user):
     mock_session.execute = AsyncMock(
-        return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=user))
+        return_value=make_exec_result(scalar_one=user)
     )
     new_password = "new_password"
 
     result = await user_repository.reset_password(user.id, new_password)
 
-    assert result.hashed_password == new_password
+    assert result is user
+    mock_session.execute.assert_called_once()
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(result)
 
 
 @pytest.mark.asyncio
 async def test_reset_password_user_not_found(user_repository, mock_session):
     mock_session.execute = AsyncMock(
-        return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=None))
+        return_value=make_exec_result(scalar_one=None)
     )
 
     result = await user_repository.reset_password(777, "new_password")